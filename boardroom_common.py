@@ -0,0 +1,333 @@
+"""
+Shared pieces of the XMRT DAO boardroom dashboards
+Supabase configuration, the pooled HTTP session, edge-function probes and page chrome
+"""
+
+import io
+import os
+import re
+import random
+import threading
+import time
+import orjson
+import requests
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError, ReadTimeoutError
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List
+import streamlit as st
+
+from utils.edge_probe import probe_edge_function
+
+# Supabase Edge Functions Configuration
+SUPABASE_URL = "https://vawouugtzwmejxqkeqqj.supabase.co"
+SUPABASE_KEY = "sb_publishable_yIaroctFhoYStx0f9XajBg_zhpuVulw"
+
+# Enhanced Edge Functions - Including New Functions
+# Read-only view, assembled once at import and shared by both dashboards
+EDGE_FUNCTIONS = MappingProxyType({
+    # Original Functions
+    "ai_chat": f"{SUPABASE_URL}/functions/v1/ai-chat",
+    "mining_proxy": f"{SUPABASE_URL}/functions/v1/mining-proxy",
+    "github_integration": f"{SUPABASE_URL}/functions/v1/github-integration",
+    "python_executor": f"{SUPABASE_URL}/functions/v1/python-executor",
+
+    # New Edge Functions
+    "task_orchestrator": f"{SUPABASE_URL}/functions/v1/task-orchestrator",
+    "system_status": f"{SUPABASE_URL}/functions/v1/system-status",
+    "ecosystem_webhook": f"{SUPABASE_URL}/functions/v1/ecosystem-webhook",
+    "monitor_device_connections": f"{SUPABASE_URL}/functions/v1/monitor-device-connections"
+})
+
+HEADERS = {
+    "Content-Type": "application/json",
+    "apikey": SUPABASE_KEY,
+    "Authorization": f"Bearer {SUPABASE_KEY}"
+}
+
+CONNECT_TIMEOUT = 3
+
+PAGE_CONFIG = {
+    "page_title": "XMRT DAO - Enhanced Autonomous System Dashboard",
+    "page_icon": "🏛️",
+    "layout": "wide",
+    "initial_sidebar_state": "collapsed"
+}
+
+HEADER_HTML = """
+<div class="main-header">
+    <h1>🏛️ XMRT DAO - Enhanced Autonomous System Dashboard</h1>
+    <p><span class="live-indicator"></span>Live Real-Time Data from Supabase Edge Functions</p>
+    <p style="font-size: 0.9rem; opacity: 0.8;">Enhanced with Task Orchestration, System Monitoring & Ecosystem Integration</p>
+</div>
+"""
+
+# Shared stylesheet in static/boardroom.css
+CSS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "boardroom.css")
+
+@st.cache_resource
+def css() -> str:
+    with open(CSS_FILE, "r") as f:
+        stylesheet = f.read()
+    # Minified once per process - the block is re-sent to the browser on every rerun
+    stylesheet = re.sub(r"/\*.*?\*/", "", stylesheet, flags=re.DOTALL)
+    stylesheet = re.sub(r"\s+", " ", stylesheet)
+    stylesheet = re.sub(r"\s*([{};,>])\s*", r"\1", stylesheet).replace(";}", "}")
+    return f"<style>{stylesheet.strip()}</style>"
+
+# Opt-in fault injection for exercising the fallback, retry and breaker paths locally:
+# XMRT_CHAOS=1 enables it, XMRT_CHAOS_RATE is the share of attempts hit (retries included),
+# XMRT_CHAOS_SEED makes the fault sequence repeatable
+CHAOS_ENABLED = os.getenv("XMRT_CHAOS") == "1"
+CHAOS_RATE = float(os.getenv("XMRT_CHAOS_RATE", "0.2"))
+CHAOS_SEED = int(os.getenv("XMRT_CHAOS_SEED", "0"))
+
+class _ChaosPool:
+    """Connection-pool mixin that fails individual attempts.
+
+    It sits below urllib3's Retry loop, so injected faults are retried, backed off
+    and counted exactly like real ones
+    """
+    
+    chaos = None  # ChaosAdapter, bound per pool class
+    
+    def _make_request(self, conn, method, url, **kwargs):
+        fault = self.chaos.pick_fault()
+        if fault is None:
+            return super()._make_request(conn, method, url, **kwargs)
+        if fault == "timeout":
+            raise ReadTimeoutError(self, url, "chaos: injected timeout")
+        if fault == "connection":
+            raise NewConnectionError(conn, "chaos: injected connection error")
+        
+        return HTTPResponse(
+            body=io.BytesIO(b'{"truncated": ' if fault == "malformed_json" else b'{"error": "chaos"}'),
+            headers={"Content-Type": "application/json"},
+            status={"http_5xx": 503, "http_429": 429}.get(fault, 200),
+            reason="Chaos",
+            preload_content=kwargs.get("preload_content", True),
+            decode_content=kwargs.get("decode_content", True),
+            connection=kwargs.get("response_conn"),
+            pool=self,
+            retries=kwargs.get("retries"),
+            request_method=method,
+            request_url=url
+        )
+
+class ChaosAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools randomly fail attempts with timeouts, connection errors, 5xx, 429 or bad JSON"""
+    
+    FAULTS = ("timeout", "connection", "http_5xx", "http_429", "malformed_json")
+    
+    def __init__(self, rate: float, seed: int, **kwargs):
+        self.rate = rate
+        self.rng = random.Random(seed)
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("ChaosHTTPConnectionPool", (_ChaosPool, HTTPConnectionPool), {"chaos": self}),
+            "https": type("ChaosHTTPSConnectionPool", (_ChaosPool, HTTPSConnectionPool), {"chaos": self})
+        }
+    
+    def pick_fault(self):
+        """Fault for the next attempt, or None to let it through"""
+        if self.rng.random() >= self.rate:
+            return None
+        return self.rng.choice(self.FAULTS)
+
+def _adapter(**kwargs) -> HTTPAdapter:
+    if CHAOS_ENABLED:
+        return ChaosAdapter(CHAOS_RATE, CHAOS_SEED, **kwargs)
+    return HTTPAdapter(**kwargs)
+
+def _retry(**kwargs) -> Retry:
+    # Transient failures only - 429 and 5xx cover Supabase cold starts and load shedding.
+    # Jittered exponential backoff only. Retry-After is ignored: it can ask for minutes,
+    # which would hang a render and a shared pool worker while the breaker never sees a failure
+    return Retry(
+        total=3, connect=2, read=1,
+        backoff_factor=0.3, backoff_jitter=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=False,
+        **kwargs
+    )
+
+# Shared HTTP session - built once per process so the TLS connection to Supabase
+# survives reruns and is shared across browser sessions and both dashboards
+@st.cache_resource
+def http_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    # POST is not retried by default so tasks, chats and webhooks are never sent twice
+    session.mount("https://", _adapter(pool_connections=4, pool_maxsize=8, max_retries=_retry()))
+    # github-integration uses POST for a read-only query, so it is safe to retry
+    session.mount(EDGE_FUNCTIONS["github_integration"], _adapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=_retry(allowed_methods=["GET", "HEAD", "POST"])
+    ))
+    return session
+
+def check_edge_function_health(function_name: str, url: str, session: requests.Session = None) -> bool:
+    """Check if an edge function is healthy"""
+    # Same short connect timeout as the data fetches, so a dead host fails the grid quickly
+    return probe_edge_function(session or http_session(), url, (CONNECT_TIMEOUT, 5))
+
+# Edge-function liveness barely changes minute to minute
+HEALTH_TTL = 60
+
+@st.cache_data(ttl=HEALTH_TTL, show_spinner=False)
+def check_all_edge_functions() -> Dict[str, bool]:
+    """Probe every edge function concurrently, keyed by function name"""
+    # Resolved here - the cache_resource lookup needs the script thread's context
+    session = http_session()
+    with ThreadPoolExecutor(max_workers=len(EDGE_FUNCTIONS)) as executor:
+        results = executor.map(
+            check_edge_function_health, EDGE_FUNCTIONS.keys(), EDGE_FUNCTIONS.values(), repeat(session)
+        )
+        return dict(zip(EDGE_FUNCTIONS, results))
+
+# Circuit breaking - the dashboards keep one breaker per edge function
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of calling an edge function whose breaker is open"""
+
+@dataclass
+class CircuitBreaker:
+    """Per-endpoint breaker: trips OPEN after repeated failures, lets one HALF_OPEN probe through after the recovery window"""
+    failure_threshold: int = 5
+    recovery_seconds: float = 30.0
+    failures: int = 0
+    opened_at: float = 0.0
+    state: str = "CLOSED"
+    probe_in_flight: bool = False
+    # Shared across sessions and fetch threads, so state changes are serialised
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    
+    def allow(self) -> bool:
+        with self.lock:
+            if self.state == "OPEN":
+                if time.time() - self.opened_at < self.recovery_seconds:
+                    return False
+                self.state = "HALF_OPEN"
+            if self.state == "HALF_OPEN":
+                # Only one caller probes the recovering endpoint; the rest wait for its result
+                if self.probe_in_flight:
+                    return False
+                self.probe_in_flight = True
+            return True
+    
+    def record(self, ok: bool):
+        with self.lock:
+            self.probe_in_flight = False
+            if ok:
+                self.failures = 0
+                self.state = "CLOSED"
+                return
+            self.failures += 1
+            if self.state == "HALF_OPEN" or self.failures >= self.failure_threshold:
+                self.state = "OPEN"
+                self.opened_at = time.time()
+    
+    def record_status(self, status_code: int):
+        # 4xx is the caller's problem, not an outage; 429 and 5xx are
+        self.record(status_code < 500 and status_code != 429)
+
+# Context sent with each AI chat request is capped so pasted blobs don't grow every POST
+CHAT_CONTEXT_TURNS = 5
+CHAT_CONTEXT_MAX_BYTES = 8192
+CHAT_MESSAGE_MAX_CHARS = 2000
+
+def build_chat_context(messages) -> Dict[str, Any]:
+    """Build the recent-history context for ai-chat, bounded in size"""
+    history = []
+    for message in list(messages)[-CHAT_CONTEXT_TURNS:]:
+        content = message["content"]
+        if len(content) > CHAT_MESSAGE_MAX_CHARS:
+            content = "[…truncated]" + content[-CHAT_MESSAGE_MAX_CHARS:]
+        history.append({**message, "content": content})
+    
+    # Drop the oldest turns until the serialized context fits
+    while history and len(orjson.dumps(history)) > CHAT_CONTEXT_MAX_BYTES:
+        history.pop(0)
+    return {"history": history}
+
+def footer_timestamp() -> str:
+    """Render time for the footer's Last updated line"""
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
+def records_table(records: List[Dict[str, Any]]):
+    """Arrow table over a list of JSON records; rows missing a key get nulls in that column"""
+    # Imported here so only the page that renders tables pays for pyarrow and pandas
+    import pandas as pd
+    import pyarrow as pa
+    
+    # Columns are the union of keys across all rows, in first-seen order
+    columns = dict.fromkeys(key for record in records for key in record)
+    try:
+        # st.dataframe ships Arrow to the browser, so an Arrow table skips the pandas round trip
+        return pa.Table.from_pydict({column: [record.get(column) for record in records] for column in columns})
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type columns - let pandas fall back to object dtype
+        return pd.DataFrame(records)
+
+# Page chrome shared by both dashboards
+
+def setup_page():
+    """Page config and stylesheet - must be the first Streamlit call of the script"""
+    st.set_page_config(**PAGE_CONFIG)
+    st.html(css())
+
+def render_header():
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+# Health grid - one HTML block laid out by CSS grid instead of a widget per function
+_HEALTH_CELL_TEMPLATE = '<div class="health-cell {state}">{icon} {name}</div>'
+
+def health_grid_html(health: Dict[str, bool]) -> str:
+    cells = "".join(
+        _HEALTH_CELL_TEMPLATE.format(
+            state="up" if health[name] else "down",
+            icon="✅" if health[name] else "❌",
+            name=name
+        )
+        for name in EDGE_FUNCTIONS
+    )
+    return f'<div class="health-grid">{cells}</div>'
+
+def render_health_grid():
+    """Edge-function health grid with its own refresh button"""
+    if st.button("🔄 Refresh Health", key="refresh_health"):
+        check_all_edge_functions.clear()
+    
+    st.markdown(health_grid_html(check_all_edge_functions()), unsafe_allow_html=True)
+
+def render_footer(*fetchers):
+    """Footer; Refresh All clears the given cached fetchers along with the health probes"""
+    st.markdown("---")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.caption("🟢 **Data Source:** Supabase Edge Functions")
+    
+    with col2:
+        st.caption("🔄 **Auto-refresh:** Every 30 seconds")
+    
+    with col3:
+        st.caption(f"📡 **Edge Functions:** {len(EDGE_FUNCTIONS)} Active")
+    
+    with col4:
+        if st.button("🔄 Refresh All Data"):
+            for fetcher in (*fetchers, check_all_edge_functions):
+                fetcher.clear()
+            st.rerun()
+    
+    st.caption(f"Last updated: {footer_timestamp()} | 🚀 100% REAL DATA - NO SIMULATIONS")
+    st.caption("Enhanced with Task Orchestration, System Monitoring, Device Connections & Ecosystem Integration")
@@ -6,7 +6,10 @@ Uses Supabase Edge Functions for all real data operations
 
 import os
 import logging
+import queue
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any, List
 import streamlit as st
 from datetime import datetime
@@ -44,6 +47,11 @@ class RealEcosystemConfig:
             "task_orchestrator": f"{self.base_url}/functions/v1/task-orchestrator"
         }
         
+        # Fire-and-forget activity log, written by a background thread so
+        # callers do not wait on the task-orchestrator round trip
+        self._activity_queue = queue.Queue()
+        threading.Thread(target=self._activity_writer, name="activity-writer", daemon=True).start()
+        
         self._test_connections()
     
     def _test_connections(self):
@@ -159,15 +167,33 @@ class RealEcosystemConfig:
             logger.error(f"❌ Failed to log activity: {e}")
             return False
     
+    def queue_activity(self, activity_type: str, data: Dict[str, Any]) -> None:
+        """
+        Log activity in the background; use log_activity when the result matters
+        """
+        self._activity_queue.put_nowait((activity_type, data))
+    
+    def _activity_writer(self):
+        while True:
+            activity_type, data = self._activity_queue.get()
+            self.log_activity(activity_type, data)
+    
+    def _fetch_mining_and_github(self):
+        """Fetch mining and GitHub data concurrently - the two calls are independent"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mining_future = executor.submit(self.get_mining_data)
+            github_future = executor.submit(self.get_github_activity)
+            return mining_future.result(), github_future.result()
+    
     def get_recent_activities(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Fetch real activities from edge functions
         """
         try:
             activities = []
+            mining_data, github_data = self._fetch_mining_and_github()
             
             # Get mining activities
-            mining_data = self.get_mining_data()
             miners = mining_data.get("miners", mining_data.get("data", []))
             for miner in miners[:limit//2]:
                 activities.append({
@@ -178,7 +204,6 @@ class RealEcosystemConfig:
                 })
             
             # Get GitHub activities
-            github_data = self.get_github_activity()
             for commit in github_data.get("commits", [])[:limit//2]:
                 activities.append({
                     "type": "github",
@@ -197,11 +222,9 @@ class RealEcosystemConfig:
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get system metrics from edge functions"""
         try:
-            mining_data = self.get_mining_data()
+            mining_data, github_data = self._fetch_mining_and_github()
             miners = mining_data.get("miners", mining_data.get("data", []))
             
-            github_data = self.get_github_activity()
-            
             return {
                 "mining": {
                     "active_miners": len(miners),
@@ -236,12 +259,16 @@ class RealEcosystemConfig:
             return False
 
 
-# Global instance
+# Global instance - built once per process; the lock keeps concurrent first
+# callers from each running the connection test and starting a writer thread
 _config = None
+_config_lock = threading.Lock()
 
 def get_ecosystem_config() -> RealEcosystemConfig:
     """Get or create the global ecosystem config"""
     global _config
     if _config is None:
-        _config = RealEcosystemConfig()
+        with _config_lock:
+            if _config is None:
+                _config = RealEcosystemConfig()
     return _config
@@ -4,9 +4,12 @@ Provides unified interface to all Supabase Edge Functions with proper error hand
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from utils.edge_probe import probe_edge_function
 from utils.logger import edge_logger
 
 class EdgeFunctionClient:
@@ -22,6 +25,11 @@ class EdgeFunctionClient:
             "Authorization": f"Bearer {api_key}"
         }
         
+        # Pooled session - calls and probes reuse keep-alive connections to the Supabase host
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        
         # Define all edge functions
         self.functions = {
             "ai_chat": f"{self.supabase_url}/functions/v1/ai-chat",
@@ -62,9 +70,9 @@ class EdgeFunctionClient:
             edge_logger.debug(f"Calling {function_name}", method=method, url=url)
             
             if method.upper() == "GET":
-                response = requests.get(url, headers=self.headers, timeout=timeout)
+                response = self.session.get(url, timeout=timeout)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=payload, timeout=timeout)
+                response = self.session.post(url, json=payload, timeout=timeout)
             else:
                 return {"error": f"Unsupported method: {method}", "success": False}
             
@@ -235,17 +243,14 @@ class EdgeFunctionClient:
         return self._call("monitor_device_connections", method="POST", payload=payload)
     
     # Health Check Functions
+    def _probe(self, url: str) -> bool:
+        """Probe one edge function URL over the client's pooled session"""
+        return probe_edge_function(self.session, url, 5)
+    
     def health_check_all(self) -> Dict[str, bool]:
-        """Check health of all edge functions"""
-        results = {}
-        
-        for func_name, func_url in self.functions.items():
-            try:
-                response = requests.get(func_url, headers=self.headers, timeout=5)
-                # 200 or 404 means the function exists
-                results[func_name] = response.status_code in [200, 404, 405]
-            except:
-                results[func_name] = False
+        """Check health of all edge functions concurrently"""
+        with ThreadPoolExecutor(max_workers=len(self.functions)) as executor:
+            results = dict(zip(self.functions, executor.map(self._probe, self.functions.values())))
         
         edge_logger.info("Health check completed", results=results)
         return results
@@ -255,12 +260,7 @@ class EdgeFunctionClient:
         if function_name not in self.functions:
             return False
         
-        try:
-            url = self.functions[function_name]
-            response = requests.get(url, headers=self.headers, timeout=5)
-            return response.status_code in [200, 404, 405]
-        except:
-            return False
+        return self._probe(self.functions[function_name])
 
 
 # Singleton instance
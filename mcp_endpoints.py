@@ -230,7 +230,8 @@ async def github_webhook(payload: Dict[str, Any] = Body(...)):
         }
     }
     
-    ecosystem.log_activity('github_webhook', webhook_data)
+    # The response does not depend on the write, so it happens in the background
+    ecosystem.queue_activity('github_webhook', webhook_data)
     
     return MCPResponse(
         status="success",
@@ -19,6 +19,8 @@ from flask_socketio import SocketIO, emit, join_room, leave_room, disconnect
 from flask_cors import CORS
 import requests
 
+from utils.agent_routing import route_agents
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -264,22 +266,8 @@ class XMRTRealTimeSystem:
                 return
             
             async def generate_responses():
-                # Determine which agents should respond
-                message_lower = message.lower()
-                responding_agents = []
-                
-                if any(word in message_lower for word in ['governance', 'vote', 'proposal', 'decision']):
-                    responding_agents.append('dao_governor')
-                if any(word in message_lower for word in ['defi', 'yield', 'farming', 'apy', 'liquidity']):
-                    responding_agents.append('defi_specialist')
-                if any(word in message_lower for word in ['community', 'users', 'growth', 'engagement']):
-                    responding_agents.append('community_manager')
-                if any(word in message_lower for word in ['security', 'risk', 'audit', 'vulnerability']):
-                    responding_agents.append('security_guardian')
-                
-                # Default to Eliza if no specific agents triggered
-                if not responding_agents:
-                    responding_agents = ['eliza']
+                # Determine which agents should respond (Eliza if none triggered)
+                responding_agents = route_agents(message)
                 
                 # Generate responses
                 for agent_id in responding_agents:
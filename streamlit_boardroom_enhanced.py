@@ -1,12 +1,21 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import requests
-import json
+import orjson
+import threading
 import time
-import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import partial
+from typing import Dict, Any, List, Tuple
 import logging
 
+from boardroom_common import (
+    CONNECT_TIMEOUT, EDGE_FUNCTIONS, HEALTH_TTL, CircuitBreaker, CircuitOpenError,
+    build_chat_context, http_session, render_footer, render_header, render_health_grid, setup_page
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,177 +24,181 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Page config
-st.set_page_config(
-    page_title="XMRT DAO - Enhanced Autonomous System Dashboard",
-    page_icon="🏛️",
-    layout="wide",
-    initial_sidebar_state="collapsed"
-)
+# Page config and shared stylesheet
+setup_page()
 
-# Supabase Edge Functions Configuration
-SUPABASE_URL = "https://vawouugtzwmejxqkeqqj.supabase.co"
-SUPABASE_KEY = "sb_publishable_yIaroctFhoYStx0f9XajBg_zhpuVulw"
-
-# Enhanced Edge Functions - Including New Functions
-EDGE_FUNCTIONS = {
-    # Original Functions
-    "ai_chat": f"{SUPABASE_URL}/functions/v1/ai-chat",
-    "mining_proxy": f"{SUPABASE_URL}/functions/v1/mining-proxy",
-    "github_integration": f"{SUPABASE_URL}/functions/v1/github-integration",
-    "python_executor": f"{SUPABASE_URL}/functions/v1/python-executor",
-    
-    # New Edge Functions
-    "task_orchestrator": f"{SUPABASE_URL}/functions/v1/task-orchestrator",
-    "system_status": f"{SUPABASE_URL}/functions/v1/system-status",
-    "ecosystem_webhook": f"{SUPABASE_URL}/functions/v1/ecosystem-webhook",
-    "monitor_device_connections": f"{SUPABASE_URL}/functions/v1/monitor-device-connections"
-}
+# Chat history is bounded so long sessions keep a constant render cost
+CHAT_HISTORY_LIMIT = 500
 
-HEADERS = {
-    "Content-Type": "application/json",
-    "apikey": SUPABASE_KEY,
-    "Authorization": f"Bearer {SUPABASE_KEY}"
-}
+# Bulkheads - AI chat runs on its own small pool so a slow model cannot starve the data fetches
+AI_POOL_WORKERS = 2
+AI_QUEUE_LIMIT = 4
+AI_CHAT_TIMEOUT = 35
+DATA_POOL_WORKERS = 8
 
-# Enhanced CSS Styling
-st.markdown("""
-<style>
-    .main > div { padding-top: 1rem; }
-    .main-header {
-        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #16213e 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-        color: white;
-        box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-    }
-    .main-header h1 {
-        font-size: clamp(1.8rem, 4vw, 3rem);
-        margin-bottom: 0.5rem;
-        background: linear-gradient(45deg, #00d4ff, #00ff88);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        color: white;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.2);
-        margin: 1rem 0;
-        transition: transform 0.2s;
-    }
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 6px 20px rgba(0, 0, 0, 0.3);
-    }
-    .status-card {
-        background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        padding: 1.2rem;
-        border-radius: 10px;
-        color: white;
-        margin: 0.5rem 0;
-    }
-    .live-indicator {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        background: #00ff88;
-        border-radius: 50%;
-        animation: pulse 2s infinite;
-        margin-right: 8px;
-    }
-    @keyframes pulse {
-        0%, 100% { opacity: 1; transform: scale(1); }
-        50% { opacity: 0.5; transform: scale(1.1); }
-    }
-    .stApp {
-        background: linear-gradient(135deg, #0a0a0a 0%, #1a1a2e 50%, #16213e 100%);
-        color: white;
-    }
-    .log-container {
-        background: #1a1a2e;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-        font-family: 'Courier New', monospace;
-        font-size: 0.9rem;
-        max-height: 400px;
-        overflow-y: auto;
-    }
-    .log-entry {
-        padding: 0.5rem;
-        margin: 0.3rem 0;
-        border-left: 3px solid #00d4ff;
-        background: rgba(255, 255, 255, 0.05);
-    }
-    .log-timestamp {
-        color: #00ff88;
-        font-weight: bold;
-    }
-    .log-level-INFO { border-left-color: #00d4ff; }
-    .log-level-WARNING { border-left-color: #ffa500; }
-    .log-level-ERROR { border-left-color: #ff4444; }
-    .log-level-SUCCESS { border-left-color: #00ff88; }
-</style>
-""", unsafe_allow_html=True)
+SESSION = http_session()
+
+def _json(response: requests.Response) -> Any:
+    """Decode an edge-function response body with orjson"""
+    return orjson.loads(response.content)
+
+# Breakers are shared by every session - an outage affects all viewers alike
+@st.cache_resource
+def _breakers() -> Dict[str, CircuitBreaker]:
+    return {}
+
+def _breaker(name: str) -> CircuitBreaker:
+    return _breakers().setdefault(name, CircuitBreaker())
+
+def edge_request(method: str, name: str, breaker: CircuitBreaker = None, **kwargs) -> requests.Response:
+    """Call an edge function through its circuit breaker"""
+    # Pool threads pass a breaker resolved on the script thread - the cache_resource lookup needs its context
+    breaker = breaker or _breaker(name)
+    if not breaker.allow():
+        raise CircuitOpenError(f"{name} circuit open, skipping call")
+    try:
+        response = SESSION.request(method, EDGE_FUNCTIONS[name], **kwargs)
+    except Exception:
+        # Every admitted call must record, or a HALF_OPEN probe would never be released
+        breaker.record(False)
+        raise
+    breaker.record_status(response.status_code)
+    return response
 
 # Enhanced Helper Functions
-def format_log_entry(timestamp: str, level: str, message: str) -> str:
-    """Format log entries with proper structure"""
-    return f"""
+_LOG_LEVEL_COLORS = {
+    "INFO": "#00d4ff",
+    "WARNING": "#ffa500",
+    "ERROR": "#ff4444",
+    "SUCCESS": "#00ff88",
+}
+
+_LOG_TEMPLATE = """
     <div class="log-entry log-level-{level}">
         <span class="log-timestamp">[{timestamp}]</span>
-        <span style="color: {'#00d4ff' if level == 'INFO' else '#ffa500' if level == 'WARNING' else '#ff4444' if level == 'ERROR' else '#00ff88'};">
+        <span style="color: {color};">
             {level}
         </span>
         : {message}
     </div>
     """
 
-@st.cache_data(ttl=30)
+def format_log_entry(timestamp: str, level: str, message: str) -> str:
+    """Format log entries with proper structure"""
+    return _LOG_TEMPLATE.format(
+        level=level,
+        timestamp=timestamp,
+        color=_LOG_LEVEL_COLORS.get(level, "#00ff88"),
+        message=message
+    )
+
+_DEVICE_TEMPLATE = (
+    "- **{name}**\n"
+    "  - Type: {type}\n"
+    "  - Status: {status}\n"
+    "  - Last Seen: {last_seen}"
+)
+
+def format_device_entry(device: Dict[str, Any]) -> str:
+    """Format one device as a markdown list item"""
+    return _DEVICE_TEMPLATE.format_map({
+        "name": device.get('name', 'Unknown'),
+        "type": device.get('type', 'N/A'),
+        "status": '🟢 Online' if device.get('status') == 'online' else '🔴 Offline',
+        "last_seen": device.get('last_seen', 'N/A'),
+    })
+
+_COMMIT_TEMPLATE = (
+    "**{index}. {message}**  \n"
+    "*{author} - {timestamp}*  \n"
+    "`{sha}`"
+)
+
+def format_commit_entry(index: int, commit: Dict[str, Any]) -> str:
+    """Format one commit as a markdown block"""
+    return _COMMIT_TEMPLATE.format_map({
+        "index": index,
+        "message": commit.get('message', 'No message'),
+        "author": commit.get('author', 'Unknown'),
+        "timestamp": commit.get('timestamp', 'Unknown time'),
+        "sha": commit.get('sha', 'N/A')[:8],
+    })
+
+_METRIC_CARD_TEMPLATE = """
+<div class="metric-card{card_class}">
+    <h3>{title}</h3>
+    <p><strong>{first}</strong> {first_label}</p>
+    <p><strong>{second}</strong> {second_label}</p>
+    <p style="font-size: 0.8rem; opacity: 0.8;">Source: {source}{stale}</p>
+</div>
+"""
+
+def metric_card_html(title: str, first: str, first_label: str,
+                     second: str, second_label: str, source: str, stale: str = "") -> str:
+    """Render an overview metric card"""
+    return _METRIC_CARD_TEMPLATE.format(
+        card_class=" stale" if stale else "",
+        title=title,
+        first=first,
+        first_label=first_label,
+        second=second,
+        second_label=second_label,
+        source=source,
+        stale=stale
+    )
+
+def mining_summary_rows(total_hashes: int, valid_shares: int, invalid_shares: int,
+                        amt_due: int, txn_count: int) -> Dict[str, List[str]]:
+    """Build the mining metrics table columns"""
+    return {
+        "Metric": ["Total Hashes", "Valid Shares", "Invalid Shares", "Amount Due", "Transactions"],
+        "Value": [f"{v:,}" for v in (total_hashes, valid_shares, invalid_shares, amt_due, txn_count)]
+    }
+
+# TTLs follow how fast each source changes: mining counters tick in seconds,
+# service status and device lists in tens of seconds, commits and contributors
+# in minutes to hours
+@st.cache_data(ttl=15, show_spinner=False)
 def get_mining_data() -> Dict[str, Any]:
     """Get real mining data from edge function"""
     try:
         logger.info("Fetching mining data from edge function")
-        response = requests.get(EDGE_FUNCTIONS["mining_proxy"], headers=HEADERS, timeout=10)
+        response = edge_request("GET", "mining_proxy", timeout=(CONNECT_TIMEOUT, 10))
         response.raise_for_status()
-        data = response.json()
-        logger.info(f"Mining data retrieved: {data.get('totalHashes', 0)} total hashes")
+        data = _json(response)
+        logger.info("Mining data retrieved: %s total hashes", data.get('totalHashes', 0))
         return data
     except Exception as e:
-        logger.error(f"Mining data error: {e}")
+        logger.error("Mining data error: %s", e)
         return {"error": str(e), "totalHashes": 0, "validShares": 0, "amtDue": 0}
 
-@st.cache_data(ttl=60)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_github_activity() -> Dict[str, Any]:
     """Get GitHub activity from edge function"""
     try:
         logger.info("Fetching GitHub activity")
-        payload = {"action": "get_recent_activity", "timestamp": datetime.now().isoformat()}
-        response = requests.post(EDGE_FUNCTIONS["github_integration"], headers=HEADERS, json=payload, timeout=30)
+        payload = {"action": "get_recent_activity"}
+        response = edge_request("POST", "github_integration", data=orjson.dumps(payload), timeout=(CONNECT_TIMEOUT, 30))
         response.raise_for_status()
-        data = response.json()
-        logger.info(f"GitHub data retrieved: {len(data.get('commits', []))} commits")
+        data = _json(response)
+        logger.info("GitHub data retrieved: %s commits", len(data.get('commits', [])))
         return data
     except Exception as e:
-        logger.error(f"GitHub data error: {e}")
+        logger.error("GitHub data error: %s", e)
         return {"error": str(e), "commits": [], "contributors": []}
 
-@st.cache_data(ttl=30)
+@st.cache_data(ttl=60, show_spinner=False)
 def get_system_status() -> Dict[str, Any]:
     """Get comprehensive system status from new edge function"""
     try:
         logger.info("Fetching system status")
-        response = requests.get(EDGE_FUNCTIONS["system_status"], headers=HEADERS, timeout=10)
+        response = edge_request("GET", "system_status", timeout=(CONNECT_TIMEOUT, 10))
         response.raise_for_status()
-        data = response.json()
+        data = _json(response)
         logger.info("System status retrieved successfully")
         return data
     except Exception as e:
-        logger.warning(f"System status error: {e}")
+        logger.warning("System status error: %s", e)
         return {
             "status": "partial",
             "services": {},
@@ -193,192 +206,292 @@ def get_system_status() -> Dict[str, Any]:
             "error": str(e)
         }
 
-@st.cache_data(ttl=20)
+@st.cache_data(ttl=30, show_spinner=False)
 def get_device_connections() -> Dict[str, Any]:
     """Monitor device connections from new edge function"""
     try:
         logger.info("Fetching device connections")
-        response = requests.get(EDGE_FUNCTIONS["monitor_device_connections"], headers=HEADERS, timeout=10)
+        response = edge_request("GET", "monitor_device_connections", timeout=(CONNECT_TIMEOUT, 10))
         response.raise_for_status()
-        data = response.json()
-        logger.info(f"Device connections: {data.get('active_devices', 0)} active")
+        data = _json(response)
+        logger.info("Device connections: %s active", data.get('active_devices', 0))
         return data
     except Exception as e:
-        logger.warning(f"Device connections error: {e}")
+        logger.warning("Device connections error: %s", e)
         return {
             "active_devices": 0,
             "devices": [],
             "error": str(e)
         }
 
+@st.cache_resource
+def _ai_bulkhead():
+    pool = ThreadPoolExecutor(max_workers=AI_POOL_WORKERS, thread_name_prefix="ai-chat")
+    slots = threading.BoundedSemaphore(AI_POOL_WORKERS + AI_QUEUE_LIMIT)
+    return pool, slots
+
+@st.cache_resource
+def _data_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=DATA_POOL_WORKERS, thread_name_prefix="edge-data")
+
 def send_ai_chat(message: str, context: Any = None) -> Dict[str, Any]:
+    """Send message to AI chat edge function through the AI bulkhead"""
+    pool, slots = _ai_bulkhead()
+    if not slots.acquire(blocking=False):
+        logger.warning("AI chat queue full, rejecting message")
+        return {"error": "AI queue full", "response": "AI queue full, please retry."}
+    
+    future = pool.submit(_post_ai_chat, message, context, _breaker("ai_chat"))
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        return future.result(timeout=AI_CHAT_TIMEOUT)
+    except FutureTimeoutError:
+        logger.error("AI chat timed out waiting for the AI pool")
+        return {"error": "timeout", "response": "AI service unavailable. Please try again."}
+
+def _post_ai_chat(message: str, context: Any = None, breaker: CircuitBreaker = None) -> Dict[str, Any]:
     """Send message to AI chat edge function"""
     try:
-        logger.info(f"Sending AI chat message: {message[:50]}...")
+        logger.info("Sending AI chat message: %s...", message[:50])
         payload = {
             "message": message,
             "context": context or {},
             "timestamp": datetime.now().isoformat()
         }
-        response = requests.post(EDGE_FUNCTIONS["ai_chat"], headers=HEADERS, json=payload, timeout=30)
+        response = edge_request(
+            "POST", "ai_chat", breaker=breaker, data=orjson.dumps(payload), timeout=(CONNECT_TIMEOUT, 30)
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _json(response)
         logger.info("AI response received")
         return data
+    except requests.HTTPError as e:
+        status = e.response.status_code
+        if 400 <= status < 500 and status != 429:
+            # Client errors will not succeed on retry - fail fast and say so; 429 is transient
+            logger.warning("AI chat rejected: %s", e)
+            return {"error": str(e), "response": "AI service rejected this message."}
+        logger.error("AI chat error: %s", e)
+        return {"error": str(e), "response": "AI service unavailable. Please try again."}
     except Exception as e:
-        logger.error(f"AI chat error: {e}")
+        logger.error("AI chat error: %s", e)
         return {"error": str(e), "response": "AI service unavailable. Please try again."}
 
 def create_task(task_data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a task via task orchestrator"""
     try:
-        logger.info(f"Creating task: {task_data.get('title', 'Untitled')}")
+        logger.info("Creating task: %s", task_data.get('title', 'Untitled'))
         payload = {
             **task_data,
             "timestamp": datetime.now().isoformat()
         }
-        response = requests.post(EDGE_FUNCTIONS["task_orchestrator"], headers=HEADERS, json=payload, timeout=15)
+        response = edge_request("POST", "task_orchestrator", data=orjson.dumps(payload), timeout=(CONNECT_TIMEOUT, 15))
         response.raise_for_status()
-        data = response.json()
-        logger.info(f"Task created: {data.get('task_id', 'unknown')}")
+        data = _json(response)
+        logger.info("Task created: %s", data.get('task_id', 'unknown'))
         return data
     except Exception as e:
-        logger.error(f"Task creation error: {e}")
+        logger.error("Task creation error: %s", e)
         return {"error": str(e), "success": False}
 
 def trigger_ecosystem_webhook(event_type: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
     """Trigger ecosystem webhook"""
     try:
-        logger.info(f"Triggering webhook: {event_type}")
+        logger.info("Triggering webhook: %s", event_type)
         payload = {
             "event_type": event_type,
             "event_data": event_data,
             "timestamp": datetime.now().isoformat()
         }
-        response = requests.post(EDGE_FUNCTIONS["ecosystem_webhook"], headers=HEADERS, json=payload, timeout=15)
+        response = edge_request("POST", "ecosystem_webhook", data=orjson.dumps(payload), timeout=(CONNECT_TIMEOUT, 15))
         response.raise_for_status()
-        data = response.json()
+        data = _json(response)
         logger.info("Webhook triggered successfully")
         return data
     except Exception as e:
-        logger.warning(f"Webhook error: {e}")
+        logger.warning("Webhook error: %s", e)
         return {"error": str(e), "success": False}
 
-def check_edge_function_health(function_name: str, url: str) -> bool:
-    """Check if an edge function is healthy"""
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=5)
-        return response.status_code in [200, 404]  # 404 means it exists but needs proper request
-    except:
-        return False
+# Last good payload per source with the time it arrived, served (marked stale)
+# when a fetch fails or its breaker is open - better than showing zeros
+@st.cache_resource
+def _last_good() -> Dict[str, Tuple[float, Dict[str, Any]]]:
+    return {}
+
+def with_last_good(key: str, fetcher) -> Dict[str, Any]:
+    """Call a cached fetcher, falling back to its last good result on error"""
+    data = fetcher()
+    if data.get('error'):
+        # Don't pin the failure in st.cache_data for the whole TTL - the breaker decides when to retry
+        fetcher.clear()
+        if key not in _last_good():
+            return data
+        fetched_at, last = _last_good()[key]
+        return {**last, "stale": True, "stale_age_s": int(time.time() - fetched_at)}
+    
+    _last_good()[key] = (time.time(), data)
+    return data
+
+def stale_note(data: Dict[str, Any]) -> str:
+    """Card suffix for data served from the last-good fallback"""
+    return f" (stale {data['stale_age_s']}s ago)" if data.get('stale') else ""
+
+def render_connection_status(data: Dict[str, Any], function_name: str):
+    """Connected banner, or a warning when the view is showing last-good data"""
+    if data.get('stale'):
+        st.warning(f"⚠️ {function_name} unavailable - showing last good data{stale_note(data)}")
+    else:
+        st.success(f"✅ Connected to {function_name} edge function")
+
+def fetch_concurrently(*fetchers):
+    """Run independent cached fetchers in parallel, returning results in order"""
+    ctx = get_script_run_ctx()
+    
+    def run(fetcher):
+        # Cached functions need the script context to resolve the session's cache
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fetcher()
+    
+    return list(_data_pool().map(run, fetchers))
+
+@st.fragment
+def render_chat():
+    """Render the chat box - a new message reruns only this fragment, not the page"""
+    # chat_input is placed inline inside a fragment, so history (old and new
+    # bubbles alike) goes into a container created above it
+    history = st.container()
+    
+    with history:
+        for message in st.session_state.messages:
+            with st.chat_message(message["role"]):
+                st.markdown(message["content"])
+        
+        if len(st.session_state.messages) == CHAT_HISTORY_LIMIT:
+            st.caption(f"Showing the last {CHAT_HISTORY_LIMIT} messages")
+    
+    # Chat input
+    if prompt := st.chat_input("Ask the AI system anything..."):
+        # Add user message
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        with history:
+            with st.chat_message("user"):
+                st.markdown(prompt)
+            
+            # Get AI response
+            with st.chat_message("assistant"):
+                with st.spinner("🤖 AI is thinking via edge function..."):
+                    response = send_ai_chat(prompt, build_chat_context(st.session_state.messages))
+                    
+                    if response.get("error"):
+                        ai_response = f"⚠️ {response.get('response', 'Service temporarily unavailable')}"
+                    else:
+                        ai_response = response.get("response", "I'm processing your request...")
+                    
+                    st.markdown(ai_response)
+        
+        # Add assistant message
+        st.session_state.messages.append({"role": "assistant", "content": ai_response})
+
+@st.fragment(run_every=HEALTH_TTL)
+def render_edge_function_health():
+    """Render the health grid - reruns on its own timer, not with the page"""
+    render_health_grid()
 
 # Header
-st.markdown("""
-<div class="main-header">
-    <h1>🏛️ XMRT DAO - Enhanced Autonomous System Dashboard</h1>
-    <p><span class="live-indicator"></span>Live Real-Time Data from Supabase Edge Functions</p>
-    <p style="font-size: 0.9rem; opacity: 0.8;">Enhanced with Task Orchestration, System Monitoring & Ecosystem Integration</p>
-</div>
-""", unsafe_allow_html=True)
+render_header()
+
+# Session state defaults - seeded in one pass on every rerun
+_STATE_DEFAULTS = {
+    "messages": deque(maxlen=CHAT_HISTORY_LIMIT),
+}
+for _key, _value in _STATE_DEFAULTS.items():
+    st.session_state.setdefault(_key, _value)
 
 # Main tabs - Enhanced with new features
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+# A radio instead of st.tabs: st.tabs runs every tab body on each rerun, so only
+# the selected view's edge functions get called this way
+VIEWS = [
     "📊 System Overview", 
     "⛏️ Mining Activity", 
     "💬 AI Chat", 
     "🔧 GitHub Activity",
     "📋 Task Orchestrator",
     "🔌 Connections & Logs"
-])
+]
+active_view = st.radio("View", VIEWS, horizontal=True, key="active_view", label_visibility="collapsed")
 
-with tab1:
+if active_view == VIEWS[0]:
     st.subheader("🔴 LIVE System Overview")
     
     # Get all real data
     with st.spinner("Loading real-time data from edge functions..."):
-        mining_data = get_mining_data()
-        github_data = get_github_activity()
-        system_status = get_system_status()
-        device_connections = get_device_connections()
+        mining_data, github_data, system_status, device_connections = fetch_concurrently(
+            partial(with_last_good, "mining_proxy", get_mining_data),
+            partial(with_last_good, "github_integration", get_github_activity),
+            partial(with_last_good, "system_status", get_system_status),
+            partial(with_last_good, "monitor_device_connections", get_device_connections)
+        )
     
     # Display enhanced metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         total_hashes = mining_data.get('totalHashes', 0)
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>⛏️ Mining</h3>
-            <p><strong>{total_hashes:,}</strong> Total Hashes</p>
-            <p><strong>{mining_data.get('validShares', 0):,}</strong> Valid Shares</p>
-            <p style="font-size: 0.8rem; opacity: 0.8;">Source: mining-proxy</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(metric_card_html(
+            "⛏️ Mining",
+            f"{total_hashes:,}", "Total Hashes",
+            f"{mining_data.get('validShares', 0):,}", "Valid Shares",
+            "mining-proxy", stale_note(mining_data)
+        ), unsafe_allow_html=True)
     
     with col2:
         commits = github_data.get('commits', [])
         contributors = github_data.get('contributors', [])
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>💻 GitHub</h3>
-            <p><strong>{len(commits)}</strong> Recent Commits</p>
-            <p><strong>{len(contributors)}</strong> Contributors</p>
-            <p style="font-size: 0.8rem; opacity: 0.8;">Source: github-integration</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(metric_card_html(
+            "💻 GitHub",
+            str(len(commits)), "Recent Commits",
+            str(len(contributors)), "Contributors",
+            "github-integration", stale_note(github_data)
+        ), unsafe_allow_html=True)
     
     with col3:
         active_devices = device_connections.get('active_devices', 0)
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>🔌 Connections</h3>
-            <p><strong>{active_devices}</strong> Active Devices</p>
-            <p><strong>{len(device_connections.get('devices', []))}</strong> Monitored</p>
-            <p style="font-size: 0.8rem; opacity: 0.8;">Source: monitor-device-connections</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(metric_card_html(
+            "🔌 Connections",
+            str(active_devices), "Active Devices",
+            str(len(device_connections.get('devices', []))), "Monitored",
+            "monitor-device-connections", stale_note(device_connections)
+        ), unsafe_allow_html=True)
     
     with col4:
         system_uptime = system_status.get('uptime', 0)
         services = system_status.get('services', {})
         active_services = sum(1 for s in services.values() if s.get('status') == 'online')
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>🖥️ System</h3>
-            <p><strong>{active_services}/{len(services)}</strong> Services Online</p>
-            <p><strong>{system_uptime}h</strong> Uptime</p>
-            <p style="font-size: 0.8rem; opacity: 0.8;">Source: system-status</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(metric_card_html(
+            "🖥️ System",
+            f"{active_services}/{len(services)}", "Services Online",
+            f"{system_uptime}h", "Uptime",
+            "system-status", stale_note(system_status)
+        ), unsafe_allow_html=True)
     
     # Enhanced Edge Function Status
     st.markdown("---")
     st.markdown("### 🟢 Edge Function Health Status")
     
-    status_cols = st.columns(4)
-    function_names = list(EDGE_FUNCTIONS.keys())
-    
-    for idx, (func_name, func_url) in enumerate(EDGE_FUNCTIONS.items()):
-        col_idx = idx % 4
-        with status_cols[col_idx]:
-            is_healthy = check_edge_function_health(func_name, func_url)
-            if is_healthy:
-                st.success(f"✅ {func_name}")
-            else:
-                st.error(f"❌ {func_name}")
+    render_edge_function_health()
     
     # System Status Details
     if system_status and not system_status.get('error'):
         with st.expander("🔍 View Detailed System Status"):
             st.json(system_status)
 
-with tab2:
+elif active_view == VIEWS[1]:
     st.subheader("⛏️ Real Mining Activity")
     
-    mining_data = get_mining_data()
+    mining_data = with_last_good("mining_proxy", get_mining_data)
     
     if not mining_data.get('error'):
-        st.success(f"✅ Connected to mining-proxy edge function")
+        render_connection_status(mining_data, "mining-proxy")
         
         # Display key metrics
         col1, col2, col3 = st.columns(3)
@@ -397,18 +510,14 @@ with tab2:
             st.metric("Transactions", f"{mining_data.get('txnCount', 0):,}")
         
         # Enhanced data table
-        df_data = {
-            "Metric": ["Total Hashes", "Valid Shares", "Invalid Shares", "Amount Due", "Transactions"],
-            "Value": [
-                f"{mining_data.get('totalHashes', 0):,}",
-                f"{mining_data.get('validShares', 0):,}",
-                f"{mining_data.get('invalidShares', 0):,}",
-                f"{mining_data.get('amtDue', 0):,}",
-                f"{mining_data.get('txnCount', 0):,}"
-            ]
-        }
-        
-        st.dataframe(pd.DataFrame(df_data), use_container_width=True)
+        summary_rows = mining_summary_rows(
+            mining_data.get('totalHashes', 0),
+            mining_data.get('validShares', 0),
+            mining_data.get('invalidShares', 0),
+            mining_data.get('amtDue', 0),
+            mining_data.get('txnCount', 0)
+        )
+        st.table(summary_rows)
         
         # Show identifier
         st.info(f"📍 Identifier: {mining_data.get('identifier', 'N/A')}")
@@ -416,64 +525,30 @@ with tab2:
     else:
         st.error(f"❌ Error: {mining_data.get('error')}")
 
-with tab3:
+elif active_view == VIEWS[2]:
     st.subheader("💬 AI Chat - Real Gemini Integration")
     st.caption("Powered by Supabase ai-chat edge function")
     
-    # Chat interface
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-    
-    # Display chat history
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-    
-    # Chat input
-    if prompt := st.chat_input("Ask the AI system anything..."):
-        # Add user message
-        st.session_state.messages.append({"role": "user", "content": prompt})
-        with st.chat_message("user"):
-            st.markdown(prompt)
-        
-        # Get AI response
-        with st.chat_message("assistant"):
-            with st.spinner("🤖 AI is thinking via edge function..."):
-                response = send_ai_chat(prompt, {"history": st.session_state.messages[-5:]})
-                
-                if response.get("error"):
-                    ai_response = f"⚠️ {response.get('response', 'Service temporarily unavailable')}"
-                else:
-                    ai_response = response.get("response", "I'm processing your request...")
-                
-                st.markdown(ai_response)
-        
-        # Add assistant message
-        st.session_state.messages.append({"role": "assistant", "content": ai_response})
-        
-        # Rerun to show updated chat
-        st.rerun()
+    render_chat()
 
-with tab4:
+elif active_view == VIEWS[3]:
     st.subheader("🔧 Real GitHub Activity")
     st.caption("Powered by Supabase github-integration edge function")
     
-    github_data = get_github_activity()
+    github_data = with_last_good("github_integration", get_github_activity)
     
     if not github_data.get('error'):
-        st.success("✅ Connected to github-integration edge function")
+        render_connection_status(github_data, "github-integration")
         
         # Display commits
         commits = github_data.get('commits', [])
         if commits:
             st.write(f"**Recent Commits:** {len(commits)}")
             
-            for i, commit in enumerate(commits[:10], 1):
-                st.markdown(f"""
-                **{i}. {commit.get('message', 'No message')}**  
-                *{commit.get('author', 'Unknown')} - {commit.get('timestamp', 'Unknown time')}*  
-                `{commit.get('sha', 'N/A')[:8]}`
-                """)
+            # One markdown element for the whole list instead of one per commit
+            st.markdown("\n\n".join(
+                format_commit_entry(i, commit) for i, commit in enumerate(commits[:10], 1)
+            ))
         else:
             st.info("No commits data available from edge function")
         
@@ -486,13 +561,13 @@ with tab4:
         
         # Refresh button
         if st.button("🔄 Refresh GitHub Data"):
-            st.cache_data.clear()
+            get_github_activity.clear()
             st.rerun()
             
     else:
         st.error(f"❌ Error: {github_data.get('error')}")
 
-with tab5:
+elif active_view == VIEWS[4]:
     st.subheader("📋 Task Orchestrator")
     st.caption("Create and manage tasks via task-orchestrator edge function")
     
@@ -531,14 +606,20 @@ with tab5:
     st.write("### Recent Tasks")
     st.info("Task history will appear here once tasks are created via the orchestrator.")
 
-with tab6:
+elif active_view == VIEWS[5]:
     st.subheader("🔌 Device Connections & System Logs")
     
     # Device Connections Section
     st.write("### Active Device Connections")
-    device_data = get_device_connections()
+    device_data, mining_data = fetch_concurrently(
+        partial(with_last_good, "monitor_device_connections", get_device_connections),
+        partial(with_last_good, "mining_proxy", get_mining_data)
+    )
     
     if not device_data.get('error'):
+        if device_data.get('stale'):
+            render_connection_status(device_data, "monitor-device-connections")
+        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -551,13 +632,7 @@ with tab6:
         devices = device_data.get('devices', [])
         if devices:
             st.write("**Connected Devices:**")
-            for device in devices:
-                st.markdown(f"""
-                - **{device.get('name', 'Unknown')}** 
-                  - Type: {device.get('type', 'N/A')}
-                  - Status: {'🟢 Online' if device.get('status') == 'online' else '🔴 Offline'}
-                  - Last Seen: {device.get('last_seen', 'N/A')}
-                """)
+            st.markdown("\n".join(format_device_entry(device) for device in devices))
         else:
             st.info("No devices currently connected")
     else:
@@ -569,18 +644,18 @@ with tab6:
     st.caption("Properly formatted logs from all edge functions")
     
     # Generate sample logs (in production, these would come from the edge functions)
+    log_time = time.strftime("%Y-%m-%d %H:%M:%S")
+    stale_sources = [name for name, data in (("monitor-device-connections", device_data), ("mining-proxy", mining_data)) if data.get('stale')]
     log_entries = [
-        format_log_entry(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "INFO", "System initialized successfully"),
-        format_log_entry(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "SUCCESS", "Connected to all edge functions"),
-        format_log_entry(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "INFO", f"Mining data retrieved: {mining_data.get('totalHashes', 0):,} hashes"),
-        format_log_entry(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "INFO", f"Active devices: {device_data.get('active_devices', 0)}"),
-        format_log_entry(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "SUCCESS", "Dashboard rendered successfully"),
+        format_log_entry(log_time, "INFO", "System initialized successfully"),
+        format_log_entry(log_time, "WARNING", f"Serving last good data for: {', '.join(stale_sources)}")
+        if stale_sources else format_log_entry(log_time, "SUCCESS", "Connected to all edge functions"),
+        format_log_entry(log_time, "INFO", f"Mining data retrieved: {mining_data.get('totalHashes', 0):,} hashes"),
+        format_log_entry(log_time, "INFO", f"Active devices: {device_data.get('active_devices', 0)}"),
+        format_log_entry(log_time, "SUCCESS", "Dashboard rendered successfully"),
     ]
     
-    st.markdown('<div class="log-container">', unsafe_allow_html=True)
-    for log_entry in reversed(log_entries):
-        st.markdown(log_entry, unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(f'<div class="log-container">{"".join(reversed(log_entries))}</div>', unsafe_allow_html=True)
     
     # Webhook Testing
     st.markdown("---")
@@ -612,22 +687,4 @@ with tab6:
                     st.error(f"❌ Webhook failed: {result.get('error', 'Unknown error')}")
 
 # Enhanced Footer
-st.markdown("---")
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.caption("🟢 **Data Source:** Supabase Edge Functions")
-
-with col2:
-    st.caption("🔄 **Auto-refresh:** Every 30 seconds")
-
-with col3:
-    st.caption(f"📡 **Edge Functions:** {len(EDGE_FUNCTIONS)} Active")
-
-with col4:
-    if st.button("🔄 Refresh All Data"):
-        st.cache_data.clear()
-        st.rerun()
-
-st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | 🚀 100% REAL DATA - NO SIMULATIONS")
-st.caption("Enhanced with Task Orchestration, System Monitoring, Device Connections & Ecosystem Integration")
+render_footer(get_mining_data, get_github_activity, get_system_status, get_device_connections)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Tests for real-time chat agent routing
+"""
+
+from utils.agent_routing import route_agents
+
+
+def test_several_agents_reply_in_fixed_order():
+    # Keywords appear in reverse of the reply order
+    message = "Security audit of the DeFi yield before the governance vote"
+    assert route_agents(message) == ["dao_governor", "defi_specialist", "security_guardian"]
+
+
+def test_matching_ignores_case():
+    assert route_agents("Community GROWTH plans") == ["community_manager"]
+
+
+def test_eliza_is_the_default():
+    assert route_agents("hello there") == ["eliza"]
+
+
+def test_keywords_match_only_at_word_start():
+    # Substring hits inside other words do not route
+    assert route_agents("undefined asterisk devote insecurity") == ["eliza"]
+    # Prefixes of longer words still do
+    assert route_agents("voters want riskier yields") == ["dao_governor", "defi_specialist", "security_guardian"]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared boardroom helpers
+"""
+
+import pandas as pd
+
+from boardroom_common import CHAT_CONTEXT_TURNS, CircuitBreaker, build_chat_context, records_table
+
+
+def test_records_table_keeps_keys_missing_from_first_row():
+    table = records_table([
+        {"sha": "a1", "message": "first"},
+        {"sha": "b2", "message": "second", "author": "dev"},
+    ])
+    assert table.column_names == ["sha", "message", "author"]
+    assert table.column("author").to_pylist() == [None, "dev"]
+
+
+def test_records_table_empty():
+    assert len(records_table([])) == 0
+
+
+def test_records_table_mixed_types_fall_back_to_dataframe():
+    table = records_table([{"sha": "a1"}, {"sha": 2}])
+    assert isinstance(table, pd.DataFrame)
+    assert list(table.columns) == ["sha"]
+
+
+def test_breaker_trips_at_threshold():
+    breaker = CircuitBreaker(failure_threshold=3)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record(False)
+    assert breaker.state == "CLOSED"
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "OPEN"
+    assert not breaker.allow()
+
+
+def test_breaker_admits_one_half_open_probe():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+    breaker.record(False)
+    assert [breaker.allow() for _ in range(5)] == [True, False, False, False, False]
+    assert breaker.state == "HALF_OPEN"
+    breaker.record(True)
+    assert breaker.state == "CLOSED"
+    assert breaker.allow() and breaker.allow()
+
+
+def test_breaker_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=60)
+    breaker.state = "HALF_OPEN"
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == "OPEN"
+    assert not breaker.allow()
+
+
+def test_breaker_counts_4xx_as_success():
+    breaker = CircuitBreaker(failure_threshold=1)
+    for status in (200, 400, 404, 422):
+        breaker.record_status(status)
+    assert breaker.state == "CLOSED"
+    assert breaker.failures == 0
+
+
+def test_breaker_counts_429_and_5xx_as_failure():
+    for status in (429, 500, 503):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_status(status)
+        assert breaker.state == "OPEN", status
+
+
+def test_chat_context_keeps_recent_turns():
+    messages = [{"role": "user", "content": str(i)} for i in range(CHAT_CONTEXT_TURNS + 3)]
+    history = build_chat_context(messages)["history"]
+    assert [m["content"] for m in history] == [m["content"] for m in messages[-CHAT_CONTEXT_TURNS:]]
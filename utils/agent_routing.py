@@ -0,0 +1,24 @@
+"""
+Agent Routing for XMRT Real-time Chat
+Picks which agents answer a user message from the keywords it contains
+"""
+
+import re
+from typing import List
+
+DEFAULT_AGENT = 'eliza'
+
+# One named group per agent, in reply order, so a single pass over the message
+# finds every agent whose keywords appear. Keywords match at the start of a word
+AGENT_ROUTER = re.compile(
+    r'(?P<dao_governor>\b(?:governance|vote|proposal|decision))'
+    r'|(?P<defi_specialist>\b(?:defi|yield|farming|apy|liquidity))'
+    r'|(?P<community_manager>\b(?:community|users|growth|engagement))'
+    r'|(?P<security_guardian>\b(?:security|risk|audit|vulnerability))',
+    re.IGNORECASE
+)
+
+def route_agents(message: str) -> List[str]:
+    """Agents that should respond to a message, in fixed order; Eliza when none match"""
+    matched = {m.lastgroup for m in AGENT_ROUTER.finditer(message)}
+    return [agent for agent in AGENT_ROUTER.groupindex if agent in matched] or [DEFAULT_AGENT]
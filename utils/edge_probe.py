@@ -0,0 +1,18 @@
+"""
+Edge Function Liveness Probe
+Shared by the dashboards' health grid and EdgeFunctionClient
+"""
+
+import requests
+
+# A bare HEAD gets 200, or 404/405 from functions that need a proper request
+# or reject HEAD - all of which mean the function is deployed and answering
+EDGE_UP_STATUSES = frozenset({200, 404, 405})
+
+def probe_edge_function(session: requests.Session, url: str, timeout) -> bool:
+    """HEAD an edge-function URL; only the status line is needed, so no body is downloaded"""
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=False)
+        return response.status_code in EDGE_UP_STATUSES
+    except requests.RequestException:
+        return False